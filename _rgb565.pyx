@@ -0,0 +1,27 @@
+# cython: language_level=3
+"""Cython wrapper around the NEON RGB888 -> RGB565 packer in rgb565.c."""
+
+from libc.stdint cimport uint8_t
+
+
+cdef extern from "rgb565.h":
+    void c_pack_rgb565 "pack_rgb565"(const uint8_t *src, uint8_t *dst, size_t npixels) nogil
+
+
+def pack_rgb565_into(const uint8_t[::1] rgb, uint8_t[::1] out):
+    """Pack interleaved RGB888 bytes into the writable buffer *out*."""
+    cdef size_t npixels = rgb.shape[0] // 3
+    if rgb.shape[0] != npixels * 3:
+        raise ValueError("RGB buffer length must be a multiple of 3")
+    if out.shape[0] != npixels * 2:
+        raise ValueError("output buffer must hold 2 bytes per pixel")
+    if npixels:
+        with nogil:
+            c_pack_rgb565(&rgb[0], &out[0], npixels)
+
+
+def pack_rgb565(rgb):
+    """Pack interleaved RGB888 bytes into big-endian RGB565 bytes."""
+    out = bytearray(len(rgb) // 3 * 2)
+    pack_rgb565_into(rgb, out)
+    return bytes(out)
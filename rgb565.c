@@ -0,0 +1,31 @@
+#include "rgb565.h"
+
+#if defined(__ARM_NEON) || defined(__ARM_NEON__)
+#include <arm_neon.h>
+#endif
+
+void pack_rgb565(const uint8_t *src, uint8_t *dst, size_t npixels)
+{
+    size_t i = 0;
+
+#if defined(__ARM_NEON) || defined(__ARM_NEON__)
+    /* 8 pixels per iteration: de-interleave, shift/or, byteswap, store. */
+    for (; i + 8 <= npixels; i += 8) {
+        uint8x8x3_t rgb = vld3_u8(src + i * 3);
+        uint16x8_t r = vshlq_n_u16(vmovl_u8(vshr_n_u8(rgb.val[0], 3)), 11);
+        uint16x8_t g = vshlq_n_u16(vmovl_u8(vshr_n_u8(rgb.val[1], 2)), 5);
+        uint16x8_t b = vmovl_u8(vshr_n_u8(rgb.val[2], 3));
+        uint16x8_t packed = vorrq_u16(vorrq_u16(r, g), b);
+        /* The ST7735 wants the high byte first */
+        vst1q_u8(dst + i * 2, vrev16q_u8(vreinterpretq_u8_u16(packed)));
+    }
+#endif
+
+    /* Scalar path for non-NEON builds and any tail pixels */
+    for (; i < npixels; i++) {
+        const uint8_t *p = src + i * 3;
+        uint16_t rgb = ((p[0] & 0xF8) << 8) | ((p[1] & 0xFC) << 3) | (p[2] >> 3);
+        dst[i * 2] = rgb >> 8;
+        dst[i * 2 + 1] = rgb & 0xFF;
+    }
+}
@@ -0,0 +1,10 @@
+#ifndef RGB565_H
+#define RGB565_H
+
+#include <stddef.h>
+#include <stdint.h>
+
+/* Pack npixels of interleaved RGB888 into big-endian RGB565 (2 bytes/pixel). */
+void pack_rgb565(const uint8_t *src, uint8_t *dst, size_t npixels);
+
+#endif
@@ -1,13 +1,47 @@
-import RPi.GPIO as GPIO
-from luma.core.interface.serial import spi as luma_spi, noop as luma_noop
+import lgpio as sbc
 import time
-from PIL import Image, ImageDraw
+from array import array
+from PIL import Image, ImageDraw, ImageOps
 import logging
+import queue
 import sys
+import threading
+import warnings
+from typing import Protocol
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # encode_rgb565() falls back to the pure-Python LUT packer
+
+try:
+    import spidev
+except ImportError:
+    spidev = None  # only needed for the "spidev" backend
+
+try:
+    from luma.core.interface.serial import spi as luma_spi, noop as luma_noop
+except ImportError:
+    luma_spi = None  # only needed for the "luma" backend
+
+try:
+    from periphery import SPI as PeripherySPI, GPIO as PeripheryGPIO
+except ImportError:
+    PeripherySPI = None  # only needed for the "periphery" backend
+
+try:
+    import _rgb565  # optional NEON packer, built with `python setup.py build_ext --inplace`
+except ImportError:
+    _rgb565 = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 # ---- LOGGING SETUP ----
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,  # DEBUG logs every SPI transfer; enable only when needed
     filename="screen.txt",
     filemode="w",
     format="%(asctime)s [%(levelname)s] %(message)s"
@@ -19,18 +53,30 @@ console.setFormatter(formatter)
 logging.getLogger().addHandler(console)
 
 # ---- PIN DEFINITIONS ----
+GPIO_CHIP = 0  # /dev/gpiochip0
 DC = 25    # Data/Command
 RST = 27   # Reset
 CS = 8     # Chip select
 BL = 24    # Backlight
 
+gpio = None  # lgpio chip handle, opened in main()
+_dc = None   # Last level written to DC, see set_dc()
+
 # ---- LCD PARAMETERS ----
 WIDTH = 128
 HEIGHT = 128
+FRAME_BYTES = WIDTH * HEIGHT * 2  # RGB565
+FB = bytearray(FRAME_BYTES)       # Reused by display_image() on every frame
+_window = None  # Last CASET/RASET window sent, see set_window()
+TILE = 16                # Dirty-tracking granularity, divides WIDTH/HEIGHT
+DIRTY_FULL_FRAME = 0.75  # Above this fraction of dirty tiles, send the whole frame
 
 # ---- SPI ----
 SPI_PORT = 0
 SPI_DEVICE = 0
+SPI_SPEED_HZ = 24000000  # ST7735 modules are typically stable at 16-32 MHz
+SPIDEV_BUFSIZ = "/sys/module/spidev/parameters/bufsiz"
+SPI_DEFAULT_CHUNK = 4096  # spidev's stock per-ioctl limit
 
 # ---- LCD COMMANDS ----
 ST7735_SWRESET = 0x01
@@ -42,102 +88,517 @@ ST7735_RAMWR   = 0x2C
 ST7735_MADCTL  = 0x36
 ST7735_COLMOD  = 0x3A
 
-def write_command(spi_interface, cmd):
-    """Send a command byte using the luma SPI interface."""
-    # Chip Select is managed by the SPI interface
-    spi_interface.command(cmd)
-    logging.debug(f"Sent command: 0x{cmd:02X}")
-
-def write_data(spi_interface, data):
-    """Send raw data bytes using the luma SPI interface."""
-    spi_interface.data(data)
-    logging.debug(
-        f"Sent data: {data[:16]}... ({len(data)} bytes)" if len(data) > 16 else f"Sent data: {data}"
-    )
+def claim_dc():
+    """Claim the DC line through lgpio for the backends that use set_dc()."""
+    global _dc
+    sbc.gpio_claim_output(gpio, DC, 0)
+    _dc = 0
+
+def set_dc(level):
+    """Drive the DC pin, skipping the GPIO write if it is already at *level*."""
+    global _dc
+    if _dc != level:
+        sbc.gpio_write(gpio, DC, level)
+        _dc = level
+
+def spi_chunk_size():
+    """Return the kernel's per-transfer spidev buffer size in bytes."""
+    try:
+        with open(SPIDEV_BUFSIZ) as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return SPI_DEFAULT_CHUNK
+
+SPI_CHUNK = spi_chunk_size()
+
+def write_chunked(write, data):
+    """Call *write* on bufsiz-sized memoryview slices of *data* (no copies)."""
+    mv = memoryview(data)
+    for i in range(0, len(mv), SPI_CHUNK):
+        write(mv[i:i + SPI_CHUNK])
+
+# ---- SPI BACKENDS ----
+class SpiBackend(Protocol):
+    """Transport used by the LCD code: command bytes go out with DC low,
+    data bytes with DC high. Chip Select is handled by the SPI driver."""
+
+    def command(self, buf): ...
+    def data(self, buf): ...
+    def close(self): ...
+
+class SpidevBackend:
+    """Talk to /dev/spidevX.Y directly, with DC driven through lgpio."""
+
+    def __init__(self):
+        if spidev is None:
+            raise RuntimeError("spidev is not installed")
+        claim_dc()
+        self._spi = spidev.SpiDev()
+        self._spi.open(SPI_PORT, SPI_DEVICE)
+        self._spi.max_speed_hz = SPI_SPEED_HZ
+        self._spi.mode = 0
+
+    def command(self, buf):
+        set_dc(0)
+        self._spi.writebytes2(buf)
+
+    def data(self, buf):
+        set_dc(1)
+        write_chunked(self._spi.writebytes2, buf)
+
+    def close(self):
+        self._spi.close()
+
+class LumaBackend:
+    """Go through luma.core's SPI interface, with DC driven through lgpio.
+
+    luma's command()/data() hand each chunk to spidev's writebytes(), which
+    converts every byte from a Python int. luma is given a noop GPIO, so
+    writing to its underlying SpiDev with writebytes2() (spidev >= 3.4)
+    is equivalent and reads straight from the buffer protocol.
+    """
+
+    def __init__(self):
+        if luma_spi is None:
+            raise RuntimeError("luma.core is not installed")
+        claim_dc()
+        self._luma = luma_spi(port=SPI_PORT, device=SPI_DEVICE, bus_speed_hz=SPI_SPEED_HZ,
+                              transfer_size=SPI_CHUNK, gpio=luma_noop())
+        dev = getattr(self._luma, "_spi", None)
+        self._write = getattr(dev, "writebytes2", None) or self._luma.data
+
+    def command(self, buf):
+        set_dc(0)
+        self._write(buf)
+
+    def data(self, buf):
+        set_dc(1)
+        write_chunked(self._write, buf)
+
+    def close(self):
+        self._luma.cleanup()
+
+class PeripheryBackend:
+    """Use python-periphery for both the SPI device and the DC line.
+
+    periphery.SPI.transfer() only accepts bytes, bytearray or list, so
+    payload chunks are copied out of their memoryview before sending.
+    """
+
+    def __init__(self):
+        if PeripherySPI is None:
+            raise RuntimeError("python-periphery is not installed")
+        self._spi = PeripherySPI(f"/dev/spidev{SPI_PORT}.{SPI_DEVICE}", 0, SPI_SPEED_HZ)
+        try:
+            self._dc = PeripheryGPIO(f"/dev/gpiochip{GPIO_CHIP}", DC, "low")
+        except Exception:
+            self._spi.close()  # e.g. DC already claimed; don't leak the SPI fd
+            raise
+        self._dc_level = False
+
+    def _set_dc(self, level):
+        if self._dc_level != level:
+            self._dc.write(level)
+            self._dc_level = level
+
+    def command(self, buf):
+        self._set_dc(False)
+        self._spi.transfer(bytes(buf))
+
+    def data(self, buf):
+        self._set_dc(True)
+        write_chunked(lambda chunk: self._spi.transfer(bytes(chunk)), buf)
+
+    def close(self):
+        self._dc.close()
+        self._spi.close()
+
+BACKENDS = {"spidev": SpidevBackend, "luma": LumaBackend, "periphery": PeripheryBackend}
+
+def write_command(spi, cmd):
+    """Send a command byte over SPI."""
+    spi.command(bytes([cmd]))
+    logging.debug("Sent command: 0x%02X", cmd)
+
+def write_data(spi, data):
+    """Send a bytes-like payload over SPI."""
+    spi.data(data)
+    # Skip slicing/hexing the payload unless someone will see it
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        if len(data) > 16:
+            logging.debug("Sent data: %s... (%d bytes)", bytes(data[:16]).hex(), len(data))
+        else:
+            logging.debug("Sent data: %s", bytes(data).hex())
+
+def cmd(spi, c, *params):
+    """Send a command followed by its parameter bytes as one data burst."""
+    write_command(spi, c)
+    if params:
+        write_data(spi, bytes(params))
 
 def lcd_init(spi):
+    global _window
     logging.info("Initializing LCD")
-    GPIO.output(RST, GPIO.HIGH)
+    _window = None  # The reset below clears the controller's window
+    sbc.gpio_write(gpio, RST, 1)
     time.sleep(0.1)
-    GPIO.output(RST, GPIO.LOW)
+    sbc.gpio_write(gpio, RST, 0)
     time.sleep(0.1)
-    GPIO.output(RST, GPIO.HIGH)
+    sbc.gpio_write(gpio, RST, 1)
     time.sleep(0.1)
 
     write_command(spi, ST7735_SWRESET)
     time.sleep(0.15)
     write_command(spi, ST7735_SLPOUT)
     time.sleep(0.15)
-    write_command(spi, ST7735_COLMOD)
-    write_data(spi, [0x05])  # 16-bit color
+    cmd(spi, ST7735_COLMOD, 0x05)  # 16-bit color
     write_command(spi, ST7735_DISPON)
     time.sleep(0.1)
+    if _rgb565 is None and not _PIL_RGB565 and np is not None and _pack_rgb565_numba is not None:
+        # Compile the Numba packer now rather than on the first frame, but
+        # only if encode_rgb565_into() will actually reach it. Go through the
+        # real path: np.asarray() of a PIL image is read-only, which Numba
+        # compiles as a different signature than a writable array.
+        encode_rgb565_into(Image.new("RGB", (WIDTH, HEIGHT)), FB)
     logging.info("LCD initialization complete")
 
 def set_window(spi, x0, y0, x1, y1):
-    write_command(spi, ST7735_CASET)
-    write_data(spi, [0x00, x0, 0x00, x1])
-    write_command(spi, ST7735_RASET)
-    write_data(spi, [0x00, y0, 0x00, y1])
-    write_command(spi, ST7735_RAMWR)
+    """Select the RAM window and start a RAMWR.
 
-def display_image(spi, img):
-    logging.info("Displaying image on LCD")
-    pix = img.convert("RGB").load()
-    buf = []
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            r, g, b = pix[x, y]
-            # Convert to 16-bit RGB565
-            rgb = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-            buf.append((rgb >> 8) & 0xFF)
-            buf.append(rgb & 0xFF)
+    RAMWR resets the write pointer to the window origin, so when the window
+    is unchanged since the last call only RAMWR needs to be sent.
+    """
+    global _window
+    if _window != (x0, y0, x1, y1):
+        cmd(spi, ST7735_CASET, 0x00, x0, 0x00, x1)
+        cmd(spi, ST7735_RASET, 0x00, y0, 0x00, y1)
+        _window = (x0, y0, x1, y1)
+    cmd(spi, ST7735_RAMWR)
+
+if njit is not None:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _pack_rgb565_numba(rgb):
+        """JIT-compiled RGB888 -> RGB565 kernel, parallel over rows."""
+        h, w, _ = rgb.shape
+        out = np.empty((h, w), np.uint16)
+        for y in prange(h):
+            for x in range(w):
+                r = rgb[y, x, 0]
+                g = rgb[y, x, 1]
+                b = rgb[y, x, 2]
+                out[y, x] = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+        return out
+else:
+    _pack_rgb565_numba = None
+
+# RGB565 contribution of each 8-bit channel value, for the pure-Python packer
+_R5 = [(r & 0xF8) << 8 for r in range(256)]
+_G6 = [(g & 0xFC) << 3 for g in range(256)]
+_B5 = [b >> 3 for b in range(256)]
+
+def _pack_rgb565_py(rgb):
+    """Pack interleaved RGB888 bytes with table lookups instead of masks/shifts."""
+    it = iter(rgb)
+    out = array("H", [_R5[r] | _G6[g] | _B5[b] for r, g, b in zip(it, it, it)])
+    if sys.byteorder == "little":
+        out.byteswap()
+    return out.tobytes()
+
+def _pack_rgb565_pil(img):
+    """Pack with PIL's C "BGR;16" converter, swapping its little-endian output."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)  # removed in Pillow 12
+        out = array("H", img.convert("BGR;16").tobytes())
+    out.byteswap()
+    return out.tobytes()
+
+def _pil_packs_rgb565():
+    """Check whether this Pillow has "BGR;16" and it matches our RGB565 packing."""
+    probe = Image.frombytes(
+        "RGB", (256, 1), bytes(v for i in range(256) for v in (i, 255 - i, i * 37 % 256))
+    )
+    try:
+        return _pack_rgb565_pil(probe) == _pack_rgb565_py(probe.tobytes())
+    except (ValueError, KeyError):
+        return False
+
+_PIL_RGB565 = _pil_packs_rgb565()
+
+def as_rgb(img):
+    """Return *img* in RGB mode, converting (and copying) only if needed."""
+    return img if img.mode == "RGB" else img.convert("RGB")
+
+def encode_rgb565_into(img, out):
+    """Pack a PIL image into *out* (a writable buffer) as big-endian RGB565.
+
+    *out* must hold exactly two bytes per pixel; ValueError otherwise
+    (checked up front so no path can resize a bytearray). Returns *out*.
+    """
+    if len(out) != img.width * img.height * 2:
+        raise ValueError(
+            f"output buffer must hold 2 bytes per pixel: {img.width}x{img.height} "
+            f"image needs {img.width * img.height * 2} bytes, got {len(out)}"
+        )
+    img = as_rgb(img)
+    if _rgb565 is not None:
+        _rgb565.pack_rgb565_into(img.tobytes(), out)
+        return out
+    if _PIL_RGB565:
+        out[:] = _pack_rgb565_pil(img)
+        return out
+    if np is None:
+        out[:] = _pack_rgb565_py(img.tobytes())
+        return out
+    arr = np.asarray(img)  # uint8[H, W, 3], no per-pixel PixelAccess calls
+    fb = np.frombuffer(out, dtype=">u2").reshape(img.height, img.width)
+    if _pack_rgb565_numba is not None:
+        fb[...] = _pack_rgb565_numba(arr)
+        return out
+    # Convert to 16-bit RGB565, big-endian as the ST7735 expects
+    r = arr[..., 0].astype(np.uint16) & 0xF8
+    g = arr[..., 1].astype(np.uint16) & 0xFC
+    b = arr[..., 2].astype(np.uint16)
+    fb[...] = (r << 8) | (g << 3) | (b >> 3)
+    return out
+
+def encode_rgb565(img):
+    """Pack a PIL image into a new big-endian RGB565 buffer ready for RAMWR."""
+    return encode_rgb565_into(img, bytearray(img.width * img.height * 2))
+
+def blit(spi, buf):
+    """Stream a pre-encoded full-screen RGB565 frame to the LCD."""
     set_window(spi, 0, 0, WIDTH-1, HEIGHT-1)
     write_data(spi, buf)
+
+def _dither_plane(plane, levels):
+    """Floyd-Steinberg dither one 0..255 channel in place to 0..levels codes.
+
+    Written with scalar indexing so the same code runs on nested lists of
+    Python floats or, through Numba, on a float64 array.
+    """
+    h = len(plane)
+    w = len(plane[0])
+    step = 255.0 / levels
+    for y in range(h):
+        row = plane[y]
+        last = y + 1 == h
+        below = row if last else plane[y + 1]
+        for x in range(w):
+            v = row[x]
+            q = float(int(min(max(v, 0.0), 255.0) / step + 0.5))
+            err = v - q * step
+            row[x] = q
+            if x + 1 < w:
+                row[x + 1] += err * 0.4375
+            if not last:
+                if x > 0:
+                    below[x - 1] += err * 0.1875
+                below[x] += err * 0.3125
+                if x + 1 < w:
+                    below[x + 1] += err * 0.0625
+
+_dither_plane_numba = njit(cache=True)(_dither_plane) if njit is not None else None
+
+def load_rgb565(path):
+    """Load an image file as a uint16[HEIGHT, WIDTH] array of big-endian RGB565.
+
+    The image is scaled and centre-cropped to the panel, then Floyd-Steinberg
+    dithered onto the 5/6/5 grid once at load time, so display_image() can
+    send it without any per-frame conversion and it takes 16 bits per pixel
+    in memory instead of 24. Requires NumPy.
+    """
+    if np is None:
+        raise RuntimeError("load_rgb565() requires NumPy")
+    with Image.open(path) as img:
+        img = as_rgb(img)
+        if img.size != (WIDTH, HEIGHT):
+            img = ImageOps.fit(img, (WIDTH, HEIGHT), Image.LANCZOS)
+        work = np.asarray(img, dtype=np.float64)
+    codes = []
+    for c, levels in enumerate((31, 63, 31)):
+        plane = np.ascontiguousarray(work[..., c])
+        if _dither_plane_numba is not None:
+            _dither_plane_numba(plane, levels)
+        else:
+            plane = plane.tolist()
+            _dither_plane(plane, levels)
+        codes.append(np.asarray(plane, dtype=np.uint16))
+    rgb = (codes[0] << 11) | (codes[1] << 5) | codes[2]
+    return rgb.astype(">u2")
+
+def display_image(spi, img):
+    """Show a PIL image, or a uint16[HEIGHT, WIDTH] RGB565 array from load_rgb565()."""
+    logging.info("Displaying image on LCD")
+    if np is not None and isinstance(img, np.ndarray):
+        if img.shape != (HEIGHT, WIDTH) or img.dtype.kind != "u" or img.dtype.itemsize != 2:
+            raise ValueError(
+                f"RGB565 array must be uint16[{HEIGHT}, {WIDTH}], "
+                f"got {img.dtype}{list(img.shape)}"
+            )
+        np.frombuffer(FB, dtype=">u2").reshape(HEIGHT, WIDTH)[...] = img
+        blit(spi, FB)
+    else:
+        blit(spi, encode_rgb565_into(img, FB))
     logging.info("Image sent to LCD")
 
-def main():
+class FrameStreamer:
+    """Double-buffered frame output for animated content.
+
+    submit() packs a frame into whichever of the two framebuffers is free
+    while a background thread streams the other one to the LCD, so packing
+    frame N+1 overlaps the SPI transfer of frame N. While the streamer is
+    open its thread is the only thing that may write to *spi*.
+    """
+
+    def __init__(self, spi):
+        self._spi = spi
+        self._free = queue.Queue()
+        self._ready = queue.Queue(maxsize=2)
+        for _ in range(2):
+            self._free.put(bytearray(FRAME_BYTES))
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="lcd-tx", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def submit(self, img):
+        """Queue *img* for display, blocking only if both buffers are busy."""
+        if self._closed:
+            raise RuntimeError("FrameStreamer is closed")
+        buf = self._free.get()
+        try:
+            encode_rgb565_into(img, buf)
+        except Exception:
+            self._free.put(buf)
+            raise
+        self._ready.put(buf)
+
+    def close(self):
+        """Wait for queued frames to finish sending and stop the thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._ready.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            buf = self._ready.get()
+            if buf is None:
+                return
+            try:
+                blit(self._spi, buf)
+            except Exception as e:
+                logging.exception(f"Frame transfer failed: {e}")
+            self._free.put(buf)
+
+class TileUpdater:
+    """Redraw only the TILE x TILE regions that changed since the last frame.
+
+    Each tile's RGB888 data is hashed and compared against the previous
+    update; unchanged tiles are not retransmitted. When most of the screen
+    changed, one full-frame blit is cheaper than many small windows.
+    Requires NumPy.
+
+    The cached hashes describe what this updater last sent, so call
+    invalidate() after drawing to the panel any other way (blit(),
+    display_image(), lcd_init(), a FrameStreamer).
+    """
+
+    def __init__(self, spi):
+        if np is None:
+            raise RuntimeError("TileUpdater requires NumPy")
+        self._spi = spi
+        self._prev_hashes = None
+
+    def invalidate(self):
+        """Forget the panel contents so the next update() redraws everything."""
+        self._prev_hashes = None
+
+    def update(self, img):
+        """Send the changed tiles of *img* and return how many were dirty."""
+        img = as_rgb(img)
+        arr = np.asarray(img)
+        rows, cols = HEIGHT // TILE, WIDTH // TILE
+        hashes = [
+            [hash(arr[ty*TILE:(ty+1)*TILE, tx*TILE:(tx+1)*TILE].tobytes()) for tx in range(cols)]
+            for ty in range(rows)
+        ]
+        prev = self._prev_hashes
+        dirty = [
+            (tx, ty) for ty in range(rows) for tx in range(cols)
+            if prev is None or hashes[ty][tx] != prev[ty][tx]
+        ]
+        if not dirty:
+            return 0
+
+        buf = encode_rgb565(img)
+        if len(dirty) > DIRTY_FULL_FRAME * rows * cols:
+            blit(self._spi, buf)
+        else:
+            fb = np.frombuffer(buf, dtype=">u2").reshape(HEIGHT, WIDTH)
+            for tx, ty in dirty:
+                x0, y0 = tx * TILE, ty * TILE
+                set_window(self._spi, x0, y0, x0 + TILE - 1, y0 + TILE - 1)
+                write_data(self._spi, fb[y0:y0 + TILE, x0:x0 + TILE].tobytes())
+        # Only now is the panel known to match; if a send fails the old
+        # hashes stay, so the unsent tiles are retried on the next update
+        self._prev_hashes = hashes
+        return len(dirty)
+
+def main(backend="spidev"):
+    global gpio
     logging.info("Program started")
-    # GPIO setup
-    GPIO.setwarnings(False)
-    GPIO.setmode(GPIO.BCM)
-    GPIO.setup(DC, GPIO.OUT)
-    GPIO.setup(RST, GPIO.OUT)
-    # The luma SPI interface manages the Chip Select line, so manual setup via
-    # RPi.GPIO is unnecessary and can cause errors.
-    # GPIO.setup(CS, GPIO.OUT)
-    GPIO.setup(BL, GPIO.OUT)
-    GPIO.output(BL, GPIO.HIGH)  # Backlight ON
-
-    # SPI setup using luma.core serial interface
+    # GPIO setup via lgpio; writes go straight to the gpiochip line handles.
+    # DC is claimed by the SPI backend, which may drive it some other way.
+    gpio = sbc.gpiochip_open(GPIO_CHIP)
+    sbc.gpio_claim_output(gpio, RST, 1)
+    # The SPI driver manages the Chip Select line (CE0), so claiming it
+    # here is unnecessary and would conflict with it.
+    # sbc.gpio_claim_output(gpio, CS, 1)
+    sbc.gpio_claim_output(gpio, BL, 1)  # Backlight ON
+
     try:
-        spi = luma_spi(port=SPI_PORT, device=SPI_DEVICE, bus_speed_hz=4000000, gpio=luma_noop())
-        logging.info(f"SPI opened (port {SPI_PORT}, device {SPI_DEVICE})")
+        spi = BACKENDS[backend]()
+        logging.info(
+            f"SPI opened via {backend} (port {SPI_PORT}, device {SPI_DEVICE}, "
+            f"{SPI_SPEED_HZ // 1000000} MHz, {SPI_CHUNK}-byte transfers)"
+        )
     except Exception as e:
         logging.exception(f"SPI open failed: {e}")
-        GPIO.cleanup()
+        sbc.gpio_write(gpio, BL, 0)  # Backlight OFF; closing the chip keeps the level
+        sbc.gpiochip_close(gpio)
         return
 
     try:
         lcd_init(spi)
         img_red = Image.new("RGB", (WIDTH, HEIGHT), (255, 0, 0))
         img_blue = Image.new("RGB", (WIDTH, HEIGHT), (0, 0, 255))
+        # The frames never change, so encode them once up front rather than
+        # converting and packing them on every switch
+        buf_red = encode_rgb565(img_red)
+        buf_blue = encode_rgb565(img_blue)
         while True:
             logging.info("Switching to RED")
-            display_image(spi, img_red)
+            blit(spi, buf_red)
             time.sleep(5)
             logging.info("Switching to BLUE")
-            display_image(spi, img_blue)
+            blit(spi, buf_blue)
             time.sleep(5)
     except KeyboardInterrupt:
         logging.info("Program interrupted by user (CTRL+C)")
     except Exception as e:
         logging.exception(f"Error during display loop: {e}")
     finally:
-        GPIO.output(BL, GPIO.LOW)  # Backlight OFF
-        GPIO.cleanup()
-        spi.cleanup()
+        sbc.gpio_write(gpio, BL, 0)  # Backlight OFF
+        sbc.gpiochip_close(gpio)
+        spi.close()
         logging.info("GPIO cleaned up, SPI closed, exiting.")
 
 if __name__ == "__main__":
-    main()
+    main(*sys.argv[1:2])
@@ -0,0 +1,27 @@
+"""Build the optional _rgb565 extension used by screen.py.
+
+    python setup.py build_ext --inplace
+"""
+import platform
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+machine = platform.machine()
+if machine == "aarch64":
+    arch_flags = ["-march=armv8-a+simd"]
+elif machine.startswith("armv7"):
+    arch_flags = ["-mfpu=neon"]
+else:
+    arch_flags = []
+
+setup(
+    name="screentest-rgb565",
+    ext_modules=cythonize([
+        Extension(
+            "_rgb565",
+            sources=["_rgb565.pyx", "rgb565.c"],
+            extra_compile_args=["-O3"] + arch_flags,
+        )
+    ]),
+)